@@ -3,12 +3,138 @@ Script para verificar la configuración del mecanismo Theo Jansen modificado
 Resuelve la cinemática y grafica el mecanismo para confirmar geometría
 """
 
+import math
+
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon, Circle
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
+from matplotlib.backends.backend_agg import RendererAgg
 from matplotlib.widgets import Slider, Button, TextBox
-from matplotlib.animation import FuncAnimation
-from scipy.optimize import fsolve
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba es opcional: sin él las funciones se ejecutan como Python normal
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
+# Optimizaciones de fastmath sin 'nnan'/'ninf': el núcleo escalar usa NaN
+# para marcar los cuadros en los que el mecanismo no cierra
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Estilo oscuro aplicado una sola vez al importar, no en cada gráfico
+plt.style.use('dark_background')
+# Simplificar trazos: menos vértices por cuadro en la trayectoria del pie
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
+def interseccion_circulos(x1, y1, r1, x2, y2, r2, signo, alcance_maximo=False):
+    """
+    Intersección de dos circunferencias (forma cerrada)
+    x1, y1, x2, y2: coordenadas de los centros, escalares o arreglos (N,)
+    r1, r2: radios
+    signo: +1 o -1, selecciona la solución a la izquierda o derecha de P1 -> P2
+    alcance_maximo: si las circunferencias no se cortan devuelve el punto de
+    máximo alcance en lugar de NaN
+    Devuelve (x, y) con la forma de las entradas; coordenadas separadas para
+    que cada operación recorra arreglos contiguos
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    d2 = dx*dx + dy*dy
+    d = np.sqrt(d2)
+    a = (r1*r1 - r2*r2 + d2) / (2 * d)
+    h2 = r1*r1 - a*a
+    if alcance_maximo:
+        h = np.sqrt(np.maximum(h2, 0.0))
+    else:
+        h = np.sqrt(np.where(h2 < 0, np.nan, h2))
+    ux = dx / d
+    uy = dy / d
+    return x1 + a*ux - signo*h*uy, y1 + a*uy + signo*h*ux
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _interseccion_escalar(x1, y1, r1, x2, y2, r2, signo):
+    """
+    Versión escalar de interseccion_circulos
+    Devuelve (NaN, NaN) si las circunferencias no se cortan o si los
+    centros coinciden, en lugar de lanzar una excepción
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    d = math.hypot(dx, dy)
+    if d == 0.0:
+        return math.nan, math.nan
+    a = (r1*r1 - r2*r2 + d*d) / (2 * d)
+    h2 = r1*r1 - a*a
+    if h2 < 0.0:
+        return math.nan, math.nan
+    h = math.sqrt(h2)
+    ux = dx / d
+    uy = dy / d
+    return x1 + a*ux - signo*h*uy, y1 + a*uy + signo*h*ux
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def resolver_cuadro(L_OA, L_AB, L_BF, L_BC, L_DE, L_EF, L_FG, L_EG,
+                    Ox, Oy, Cx, Cy, Dx, Dy, sen_OA, cos_OA, signo_B, signo_E, signo_G):
+    """
+    Resuelve la cinemática de posición para un ángulo de manivela
+    Recibe el seno y coseno del ángulo ya calculados (tabla o math)
+    Devuelve un arreglo (5, 2) con las filas A, B, E, F, G; las articulaciones
+    quedan en NaN si el mecanismo no cierra para ese ángulo
+    """
+    puntos = np.empty((5, 2))
+    
+    # Punto A (conectado a manivela)
+    Ax = Ox + L_OA * sen_OA
+    Ay = Oy + L_OA * cos_OA
+    
+    # B: |AB| = L_AB, |BC| = L_BC
+    Bx, By = _interseccion_escalar(Ax, Ay, L_AB, Cx, Cy, L_BC, signo_B)
+    
+    # F en línea recta AFB
+    L_AF = (L_AB + L_BF) / math.hypot(Bx - Ax, By - Ay)
+    Fx = Ax + L_AF * (Bx - Ax)
+    Fy = Ay + L_AF * (By - Ay)
+    
+    # E: |DE| = L_DE, |EF| = L_EF
+    Ex, Ey = _interseccion_escalar(Dx, Dy, L_DE, Fx, Fy, L_EF, signo_E)
+    
+    # G: |FG| = L_FG, |EG| = L_EG
+    Gx, Gy = _interseccion_escalar(Fx, Fy, L_FG, Ex, Ey, L_EG, signo_G)
+    
+    puntos[0, 0], puntos[0, 1] = Ax, Ay
+    puntos[1, 0], puntos[1, 1] = Bx, By
+    puntos[2, 0], puntos[2, 1] = Ex, Ey
+    puntos[3, 0], puntos[3, 1] = Fx, Fy
+    puntos[4, 0], puntos[4, 1] = Gx, Gy
+    return puntos
+
+
+def _direccion(x1, y1, x2, y2):
+    """Coseno y seno del ángulo del vector P1 -> P2 (sin pasar por atan2)"""
+    d = math.hypot(x2 - x1, y2 - y1)
+    return (x2 - x1) / d, (y2 - y1) / d
+
+
+def _resolver_2x2(a11, a12, a21, a22, b1, b2):
+    """
+    Resuelve el sistema lineal 2x2 [[a11, a12], [a21, a22]] x = b (regla de Cramer)
+    Devuelve None si la matriz es singular (eslabones alineados)
+    """
+    det = a11 * a22 - a12 * a21
+    if abs(det) <= 1e-12 * (abs(a11 * a22) + abs(a12 * a21)):
+        return None
+    return (b1 * a22 - a12 * b2) / det, (a11 * b2 - b1 * a21) / det
+
 
 class MecanismoVerificacion:
     def __init__(self):
@@ -16,6 +142,9 @@ class MecanismoVerificacion:
         self.O = np.array([0.0, 0.0])
         self.C = np.array([-4.3, -1.2])
         self.D = np.array([-2.0, 1.3])
+        # Los mismos apoyos en orden fijo (Ox, Oy, Cx, Cy, Dx, Dy) como floats
+        # de Python, listos para desempaquetar en el núcleo numérico
+        self._coord_fijos = tuple(self.O.tolist() + self.C.tolist() + self.D.tolist())
         
         # Longitudes de eslabones (en cm)
         self.L_OA = 1.0
@@ -27,47 +156,103 @@ class MecanismoVerificacion:
         self.L_FG = 5.65
         self.L_EG = 9.1
         
-        # Variables para mantener continuidad (evitar colapsos)
-        self.E_prev = None
-        self.G_prev = None
-        self.B_prev = None
+        # Rama de cada intersección (+1/-1), se fija en la primera solución
+        # para mantener continuidad (evitar colapsos)
+        self.signo_B = None
+        self.signo_E = None
+        self.signo_G = None
+        self._clave_signos = None  # longitudes con las que se eligieron las ramas
+        
+        # Última solución: (clave, theta_OA, puntos)
+        # Se reutiliza si se vuelve a pedir el mismo ángulo y sirve de semilla
+        # para elegir las ramas cuando cambian las longitudes
+        self._prev = None
+        
+        # Trayectoria del pie en caché: (clave, trayectoria, x_min, x_max, y_min, y_max)
+        # Solo depende de las longitudes, no del ángulo actual
+        self._trayectoria_cache = None
+        
+        # Tabla de la animación: ángulos de una vuelta con paso fijo para la
+        # velocidad angular actual, con su seno/coseno por ángulo.
+        # Se construye al pulsar Play o al cambiar la velocidad
+        self._angulos_animacion = []
+        self._trig_animacion = {}
+        self._omega_animacion = None
+        self._cuadro_animacion = 0
         
         # Variables para calcular velocidad
         self.G_prev_pos = None
         self.theta_prev = None
         self.tiempo_prev = None
         
-    def calcular_posiciones(self, theta_OA):
+    def calcular_posiciones(self, theta_OA, trig=None):
         """
         Resuelve las posiciones de todos los puntos dado el ángulo de la manivela
         theta_OA: ángulo de la manivela OA en radianes
+        trig: (seno, coseno) de theta_OA ya calculados (opcional)
+        El diccionario devuelto es el mismo que guarda la caché: no debe
+        modificarse (los arreglos de las articulaciones son de solo lectura)
+        """
+        clave = self._clave_longitudes()
+        if self._prev is not None and self._prev[0] == clave and self._prev[1] == theta_OA:
+            return self._prev[2]
+        
+        puntos = self._resolver_posiciones(clave, theta_OA, trig)
+        self._prev = (clave, theta_OA, puntos)
+        return puntos
+    
+    def _resolver_posiciones(self, clave, theta_OA, trig=None):
+        """
+        Resuelve un cuadro sin leer ni modificar la caché de la última solución
+        clave: longitudes actuales (ver _clave_longitudes)
+        """
+        if self._clave_signos != clave:
+            self._fijar_signos(theta_OA)
+        
+        sen_OA, cos_OA = trig if trig is not None else (math.sin(theta_OA), math.cos(theta_OA))
+        # La clave ya trae las longitudes en el orden de resolver_cuadro
+        cuadro = resolver_cuadro(
+            *clave, *self._coord_fijos, sen_OA, cos_OA, self.signo_B, self.signo_E, self.signo_G)
+        cuadro.flags.writeable = False
+        A, B, E, F, G = cuadro
+        
+        puntos = {
+            'O': self.O,
+            'A': A,
+            'B': B,
+            'C': self.C,
+            'D': self.D,
+            'E': E,
+            'F': F,
+            'G': G
+        }
+        return puntos
+    
+    def _fijar_signos(self, theta_OA=None):
+        """
+        Elige la rama de cada articulación
+        Usa como semilla la solución previa si existe (continuidad entre cuadros);
+        en la primera llamada usa estimaciones geométricas
+        theta_OA: ángulo de la manivela OA en radianes (por defecto el de la solución previa)
         """
+        previo = self._prev[2] if self._prev is not None else None
+        if previo is not None and not np.isfinite(previo['G']).all():
+            # Un cuadro en el que el mecanismo no cierra no sirve de semilla
+            previo = None
+        if theta_OA is None:
+            theta_OA = self._prev[1] if self._prev is not None else 0.0
+        
         # Punto A (conectado a manivela)
         A = self.O + self.L_OA * np.array([np.sin(theta_OA), np.cos(theta_OA)])
         
         # Resolver para B usando circuitos vectoriales
         # Circuito: O -> A -> B -> C -> O
-        def ecuaciones_B(vars):
-            xB, yB = vars
-            B = np.array([xB, yB])
-            
-            # Restricción 1: |AB| = L_AB
-            eq1 = np.linalg.norm(B - A) - self.L_AB
-            
-            # Restricción 2: |BC| = L_BC
-            eq2 = np.linalg.norm(self.C - B) - self.L_BC
-            
-            return [eq1, eq2]
-        
-        # Estimación inicial para B (usar posición previa si existe)
-        if self.B_prev is not None:
-            B_guess = self.B_prev
+        # B es la intersección de |AB| = L_AB y |BC| = L_BC
+        if previo is not None:
+            B_guess = previo['B']
         else:
             B_guess = A + self.L_AB * np.array([-0.7, 0.3])
-        
-        sol_B = fsolve(ecuaciones_B, B_guess)
-        B = np.array(sol_B)
-        self.B_prev = B
+        self.signo_B, B = self._elegir_signo(A, self.L_AB, self.C, self.L_BC, B_guess)
         
         # Punto F está en línea recta AFB
         # F = A + (L_AB + L_BF) * dirección_AB
@@ -76,203 +261,256 @@ class MecanismoVerificacion:
         
         # Resolver para E usando circuito: D -> E -> F
         # E debe estar DEBAJO de F (F es el vértice superior del triángulo)
-        def ecuaciones_E(vars):
-            xE, yE = vars
-            E = np.array([xE, yE])
-            
-            # Restricción 1: |DE| = L_DE
-            eq1 = np.linalg.norm(E - self.D) - self.L_DE
-            
-            # Restricción 2: |EF| = L_EF
-            eq2 = np.linalg.norm(F - E) - self.L_EF
-            
-            return [eq1, eq2]
-        
-        # Estimación inicial para E (usar posición previa para continuidad)
-        if self.E_prev is not None:
-            E_guess = self.E_prev
+        if previo is not None:
+            E_guess = previo['E']
         else:
             E_guess = F + np.array([-2, 4])  # E abajo y a la izquierda de F
-        
-        sol_E = fsolve(ecuaciones_E, E_guess)
-        E = np.array(sol_E)
-        
-        # Verificar que E cumpla con la restricción DE y mantenga orientación
-        dist_DE = np.linalg.norm(E - self.D)
-        if abs(dist_DE - self.L_DE) > 0.1:
-            # Probar otra configuración
-            E_guess = F + np.array([1, 5])
-            sol_E = fsolve(ecuaciones_E, E_guess)
-            E = np.array(sol_E)
-        
-        self.E_prev = E
+        self.signo_E, E = self._elegir_signo(self.D, self.L_DE, F, self.L_EF, E_guess)
         
         # Resolver para G usando triángulo EFG
         # G debe estar ABAJO, al mismo nivel o más abajo que E
-        def ecuaciones_G(vars):
-            xG, yG = vars
-            G = np.array([xG, yG])
-            
-            # Restricción 1: |FG| = L_FG
-            eq1 = np.linalg.norm(G - F) - self.L_FG
-            
-            # Restricción 2: |EG| = L_EG
-            eq2 = np.linalg.norm(G - E) - self.L_EG
-            
-            return [eq1, eq2]
-        
-        # Estimación inicial para G (usar posición previa para continuidad)
-        if self.G_prev is not None:
-            G_guess = self.G_prev
+        if previo is not None:
+            G_guess = previo['G']
         else:
             G_guess = E + np.array([6, 3])  # ABAJO y a la derecha de E
+        self.signo_G, _ = self._elegir_signo(F, self.L_FG, E, self.L_EG, G_guess)
         
-        sol_G = fsolve(ecuaciones_G, G_guess)
-        G = np.array(sol_G)
-        self.G_prev = G
+        self._clave_signos = self._clave_longitudes()
+    
+    def calcular_trayectoria(self, n_puntos=120):
+        """
+        Calcula la trayectoria del pie G para una vuelta completa de la manivela
+        Resuelve todos los ángulos a la vez con operaciones vectoriales
+        Devuelve un arreglo (n_puntos, 2); NaN donde el mecanismo no cierra
+        (más un punto por cada límite de cierre, localizado por bisección)
+        Se recalcula solo si cambian las longitudes de los eslabones
+        """
+        clave = (self._clave_longitudes(), n_puntos)
+        if self._trayectoria_cache is not None and self._trayectoria_cache[0] == clave:
+            return self._trayectoria_cache[1]
         
-        return {
-            'O': self.O,
-            'A': A,
-            'B': B,
-            'C': self.C,
-            'D': self.D,
-            'E': E,
-            'F': F,
-            'G': G
-        }
+        # Fijar las ramas de cada articulación para las longitudes actuales
+        if self._clave_signos != self._clave_longitudes():
+            self._fijar_signos()
+        
+        theta = np.linspace(0, 2*np.pi, n_puntos)
+        G = self._posiciones_pie(theta)
+        
+        # Densificación adaptativa: los extremos de la trayectoria suelen estar
+        # justo donde el mecanismo deja de cerrar, así que en cada cambio
+        # válido/NaN se localiza el ángulo límite y se inserta ese punto
+        valido = ~np.isnan(G[:, 0])
+        cambios = np.where(valido[:-1] != valido[1:])[0]
+        if len(cambios) > 0:
+            theta_a, theta_b = theta[cambios], theta[cambios + 1]
+            valido_a = valido[cambios]
+            for _ in range(40):
+                theta_m = 0.5 * (theta_a + theta_b)
+                valido_m = ~np.isnan(self._posiciones_pie(theta_m)[:, 0])
+                igual_a = valido_m == valido_a
+                theta_a = np.where(igual_a, theta_m, theta_a)
+                theta_b = np.where(igual_a, theta_b, theta_m)
+            theta_limite = np.where(valido_a, theta_a, theta_b)
+            G = np.insert(G, cambios + 1, self._posiciones_pie(theta_limite), axis=0)
+        
+        # Extremos de la trayectoria para las métricas de paso
+        x_min, x_max = np.nanmin(G[:, 0]), np.nanmax(G[:, 0])
+        y_min, y_max = np.nanmin(G[:, 1]), np.nanmax(G[:, 1])
+        
+        self._trayectoria_cache = (clave, G, x_min, x_max, y_min, y_max)
+        return G
+    
+    def _posiciones_pie(self, theta):
+        """Posición del pie G para un arreglo de ángulos de manivela (N,) -> (N, 2)"""
+        Ox, Oy, Cx, Cy, Dx, Dy = self._coord_fijos
+        L_OA, L_AB, L_BF, L_BC, L_DE, L_EF, L_FG, L_EG = self._clave_longitudes()
+        
+        Ax = Ox + L_OA * np.sin(theta)
+        Ay = Oy + L_OA * np.cos(theta)
+        Bx, By = interseccion_circulos(Ax, Ay, L_AB, Cx, Cy, L_BC, self.signo_B)
+        L_AF = (L_AB + L_BF) / np.hypot(Bx - Ax, By - Ay)
+        Fx = Ax + L_AF * (Bx - Ax)
+        Fy = Ay + L_AF * (By - Ay)
+        Ex, Ey = interseccion_circulos(Dx, Dy, L_DE, Fx, Fy, L_EF, self.signo_E)
+        Gx, Gy = interseccion_circulos(Fx, Fy, L_FG, Ex, Ey, L_EG, self.signo_G)
+        
+        # Solo al final se agrupa en (N, 2), el formato que espera el gráfico
+        return np.stack([Gx, Gy], axis=1)
     
-    def calcular_velocidad_G(self, theta_OA, omega):
+    def metricas_paso(self):
+        """
+        Longitud y altura de paso del pie G (en cm), sobre la parte del ciclo
+        en la que el mecanismo cierra
+        Se leen de la caché de la trayectoria, no se recorren los puntos
+        """
+        self.calcular_trayectoria()
+        _, _, x_min, x_max, y_min, y_max = self._trayectoria_cache
+        return x_max - x_min, y_max - y_min
+    
+    def _clave_longitudes(self):
+        """
+        Tupla con las longitudes actuales, identifica la geometría del mecanismo
+        El orden (OA, AB, BF, BC, DE, EF, FG, EG) es el de los argumentos de resolver_cuadro
+        """
+        return (self.L_OA, self.L_AB, self.L_BF, self.L_BC,
+                self.L_DE, self.L_EF, self.L_FG, self.L_EG)
+    
+    def _elegir_signo(self, p1, r1, p2, r2, estimacion):
+        """
+        Devuelve la rama de la intersección más cercana a la estimación
+        y el punto correspondiente: (signo, punto)
+        """
+        candidatos = {signo: np.array(interseccion_circulos(p1[0], p1[1], r1, p2[0], p2[1], r2,
+                                                            signo, alcance_maximo=True))
+                      for signo in (1, -1)}
+        signo = min(candidatos, key=lambda s: np.linalg.norm(candidatos[s] - estimacion))
+        return signo, candidatos[signo]
+    
+    def _preparar_animacion(self, omega, fps=30):
+        """
+        Construye la tabla de ángulos de la animación para la velocidad omega (rad/s)
+        El paso por cuadro se ajusta para que una vuelta tenga un número entero
+        de cuadros; el cuadro actual pasa al más cercano al ángulo mostrado
+        """
+        paso = np.rad2deg(omega) / fps
+        n_cuadros = max(1, round(360 / paso))
+        angulos = np.arange(n_cuadros) * (360 / n_cuadros)
+        radianes = np.deg2rad(angulos)
+        self._angulos_animacion = angulos.tolist()
+        self._trig_animacion = dict(zip(self._angulos_animacion,
+                                        zip(np.sin(radianes).tolist(),
+                                            np.cos(radianes).tolist())))
+        self._cuadro_animacion = round(self.angulo_actual * n_cuadros / 360) % n_cuadros
+        self._omega_animacion = omega
+    
+    def _trig_grados(self, theta_grados):
+        """
+        Seno y coseno de un ángulo en grados: de la tabla si es un cuadro de la
+        animación, calculados al vuelo en otro caso (slider, reset)
+        """
+        trig = self._trig_animacion.get(theta_grados)
+        if trig is not None:
+            return trig
+        theta_OA = math.radians(theta_grados)
+        return math.sin(theta_OA), math.cos(theta_OA)
+    
+    def calcular_velocidad_G(self, theta_OA, omega, trig=None):
         """
         Calcula la velocidad lineal del punto G usando ecuaciones dinámicas
         Deriva las ecuaciones de restricción vectoriales para obtener velocidades
         theta_OA: ángulo actual de la manivela en radianes
         omega: velocidad angular de la manivela en rad/s (ω₂)
+        trig: (seno, coseno) de theta_OA ya calculados (opcional)
         """
-        try:
-            # Obtener posiciones actuales
-            puntos = self.calcular_posiciones(theta_OA)
-            A = puntos['A']
-            B = puntos['B']
-            E = puntos['E']
-            F = puntos['F']
-            G = puntos['G']
-            
-            # Velocidad del punto A (extremo de la manivela)
-            # v_A = ω₂ × r_OA = ω₂ * L_OA * [-sin(θ₂), cos(θ₂)]
-            v_A = omega * self.L_OA * np.array([-np.sin(theta_OA), np.cos(theta_OA)])
-            
-            # Calcular ángulos de los eslabones
-            # Ángulo del eslabón AB
-            vec_AB = B - A
-            theta_AB = np.arctan2(vec_AB[1], vec_AB[0])
-            
-            # Ángulo del eslabón BC
-            vec_BC = self.C - B
-            theta_BC = np.arctan2(vec_BC[1], vec_BC[0])
-            
-            # Ecuación de restricción del circuito O-A-B-C:
-            # Derivando: v_A + ω_AB × r_AB + ω_BC × r_BC = 0
-            # Componentes perpendiculares para resolver ω_AB y ω_BC
-            
-            # Matriz jacobiana del circuito O-A-B-C
-            J1 = np.array([
-                [-self.L_AB * np.sin(theta_AB), -self.L_BC * np.sin(theta_BC)],
-                [self.L_AB * np.cos(theta_AB), self.L_BC * np.cos(theta_BC)]
-            ])
-            
-            b1 = -v_A
-            
-            try:
-                velocidades_angulares_1 = np.linalg.solve(J1, b1)
-                omega_AB = velocidades_angulares_1[0]
-                omega_BC = velocidades_angulares_1[1]
-            except:
-                return 0.0, np.array([0.0, 0.0])
-            
-            # Velocidad de B
-            v_B = v_A + omega_AB * self.L_AB * np.array([-np.sin(theta_AB), np.cos(theta_AB)])
-            
-            # Velocidad de F (está en línea con A y B)
-            # F = A + (L_AB + L_BF) * dirección_AB
-            v_F = v_A + omega_AB * (self.L_AB + self.L_BF) * np.array([-np.sin(theta_AB), np.cos(theta_AB)])
-            
-            # Calcular ángulos del triángulo DEF-G
-            vec_DE = E - self.D
-            theta_DE = np.arctan2(vec_DE[1], vec_DE[0])
-            
-            vec_EF = F - E
-            theta_EF = np.arctan2(vec_EF[1], vec_EF[0])
-            
-            vec_FG = G - F
-            theta_FG = np.arctan2(vec_FG[1], vec_FG[0])
-            
-            vec_EG = G - E
-            theta_EG = np.arctan2(vec_EG[1], vec_EG[0])
-            
-            # Circuito D-E-F con velocidad conocida de F
-            # v_F = v_D + ω_DE × r_DE + ω_EF × r_EF
-            # v_D = 0 (punto fijo)
-            
-            J2 = np.array([
-                [-self.L_DE * np.sin(theta_DE), -self.L_EF * np.sin(theta_EF)],
-                [self.L_DE * np.cos(theta_DE), self.L_EF * np.cos(theta_EF)]
-            ])
-            
-            b2 = v_F
-            
-            try:
-                velocidades_angulares_2 = np.linalg.solve(J2, b2)
-                omega_DE = velocidades_angulares_2[0]
-                omega_EF = velocidades_angulares_2[1]
-            except:
-                return 0.0, np.array([0.0, 0.0])
-            
-            # Velocidad de E
-            v_E = omega_DE * self.L_DE * np.array([-np.sin(theta_DE), np.cos(theta_DE)])
-            
-            # Circuito cerrado E-F-G-E para encontrar ω_FG y ω_EG
-            # v_F + ω_FG × r_FG = v_E + ω_EG × r_EG
-            
-            J3 = np.array([
-                [-self.L_FG * np.sin(theta_FG), self.L_EG * np.sin(theta_EG)],
-                [self.L_FG * np.cos(theta_FG), -self.L_EG * np.cos(theta_EG)]
-            ])
-            
-            b3 = v_E - v_F
-            
-            try:
-                velocidades_angulares_3 = np.linalg.solve(J3, b3)
-                omega_FG = velocidades_angulares_3[0]
-                omega_EG = velocidades_angulares_3[1]
-            except:
-                # Método alternativo: usar solo v_G = v_F + ω_FG × r_FG
-                omega_FG = 0
-            
-            # Velocidad del punto G
-            v_G = v_F + omega_FG * self.L_FG * np.array([-np.sin(theta_FG), np.cos(theta_FG)])
-            
-            # Magnitud de la velocidad
-            velocidad_magnitud = np.linalg.norm(v_G)
-            
-            return velocidad_magnitud, v_G
-            
-        except Exception as e:
+        # Obtener posiciones actuales (como escalares para evitar
+        # crear arreglos pequeños en cada operación)
+        puntos = self.calcular_posiciones(theta_OA, trig)
+        Ax, Ay = puntos['A'].tolist()
+        Bx, By = puntos['B'].tolist()
+        Ex, Ey = puntos['E'].tolist()
+        Fx, Fy = puntos['F'].tolist()
+        Gx, Gy = puntos['G'].tolist()
+        _, _, Cx, Cy, Dx, Dy = self._coord_fijos
+        
+        # Longitudes como variables locales (una sola lectura de atributos)
+        L_OA, L_AB, L_BF, L_BC, L_DE, L_EF, L_FG, L_EG = self._clave_longitudes()
+        
+        # Velocidad del punto A (extremo de la manivela)
+        # v_A = ω₂ × r_OA = ω₂ * L_OA * [-sin(θ₂), cos(θ₂)]
+        sen_OA, cos_OA = trig if trig is not None else (math.sin(theta_OA), math.cos(theta_OA))
+        vAx = -omega * L_OA * sen_OA
+        vAy = omega * L_OA * cos_OA
+        
+        # Dirección de los eslabones: L·[cos θ, sin θ] a partir de los vectores
+        # Ángulo del eslabón AB
+        cos_AB, sen_AB = _direccion(Ax, Ay, Bx, By)
+        
+        # Ángulo del eslabón BC
+        cos_BC, sen_BC = _direccion(Bx, By, Cx, Cy)
+        
+        # Ecuación de restricción del circuito O-A-B-C:
+        # Derivando: v_A + ω_AB × r_AB + ω_BC × r_BC = 0
+        # Componentes perpendiculares para resolver ω_AB y ω_BC
+        
+        # Matriz jacobiana del circuito O-A-B-C (analítica)
+        # J1 = [[-L_AB sin θ_AB, -L_BC sin θ_BC], [L_AB cos θ_AB, L_BC cos θ_BC]]
+        sol_1 = _resolver_2x2(-L_AB * sen_AB, -L_BC * sen_BC,
+                              L_AB * cos_AB, L_BC * cos_BC,
+                              -vAx, -vAy)
+        if sol_1 is None:
+            return 0.0, np.array([0.0, 0.0])
+        omega_AB, omega_BC = sol_1
+        
+        # Velocidad de F (está en línea con A y B)
+        # F = A + (L_AB + L_BF) * dirección_AB
+        L_AF = L_AB + L_BF
+        vFx = vAx - omega_AB * L_AF * sen_AB
+        vFy = vAy + omega_AB * L_AF * cos_AB
+        
+        # Dirección de los eslabones del triángulo DEF-G
+        cos_DE, sen_DE = _direccion(Dx, Dy, Ex, Ey)
+        
+        cos_EF, sen_EF = _direccion(Ex, Ey, Fx, Fy)
+        
+        cos_FG, sen_FG = _direccion(Fx, Fy, Gx, Gy)
+        
+        cos_EG, sen_EG = _direccion(Ex, Ey, Gx, Gy)
+        
+        # Circuito D-E-F con velocidad conocida de F
+        # v_F = v_D + ω_DE × r_DE + ω_EF × r_EF
+        # v_D = 0 (punto fijo)
+        
+        sol_2 = _resolver_2x2(-L_DE * sen_DE, -L_EF * sen_EF,
+                              L_DE * cos_DE, L_EF * cos_EF,
+                              vFx, vFy)
+        if sol_2 is None:
             return 0.0, np.array([0.0, 0.0])
+        omega_DE, omega_EF = sol_2
+        
+        # Velocidad de E
+        vEx = -omega_DE * L_DE * sen_DE
+        vEy = omega_DE * L_DE * cos_DE
+        
+        # Circuito cerrado E-F-G-E para encontrar ω_FG y ω_EG
+        # v_F + ω_FG × r_FG = v_E + ω_EG × r_EG
+        
+        sol_3 = _resolver_2x2(-L_FG * sen_FG, L_EG * sen_EG,
+                              L_FG * cos_FG, -L_EG * cos_EG,
+                              vEx - vFx, vEy - vFy)
+        if sol_3 is not None:
+            omega_FG, omega_EG = sol_3
+        else:
+            # Método alternativo: usar solo v_G = v_F + ω_FG × r_FG
+            omega_FG = 0
+        
+        # Velocidad del punto G
+        vGx = vFx - omega_FG * L_FG * sen_FG
+        vGy = vFy + omega_FG * L_FG * cos_FG
+        
+        # Magnitud de la velocidad
+        velocidad_magnitud = math.hypot(vGx, vGy)
+        
+        return velocidad_magnitud, np.array([vGx, vGy])
     
     def graficar_interactivo(self):
         """Grafica el mecanismo con un slider interactivo para cambiar el ángulo"""
-        # Configurar estilo oscuro
-        plt.style.use('dark_background')
-        
-        fig = plt.figure(figsize=(18, 12))
+        # dpi=80 en modo interactivo: ~40% menos píxeles que rasterizar en cada cuadro
+        fig = plt.figure(figsize=(18, 12), dpi=80)
         fig.patch.set_facecolor('#1e1e1e')
         
         # Crear grid para layout - aumentar rowspan para que la gráfica sea más grande
-        ax = plt.subplot2grid((10, 1), (0, 0), rowspan=9)
+        grid = fig.add_gridspec(10, 1)
+        ax = fig.add_subplot(grid[0:9, 0])
         ax.set_facecolor('#2d2d2d')
         
-        plt.subplots_adjust(bottom=0.12, left=0.06, right=0.96, top=0.97)
+        fig.subplots_adjust(bottom=0.12, left=0.06, right=0.96, top=0.97)
+        
+        # Título principal con mejor estilo
+        # Se superpone al borde superior de los ejes: es animado para pintarlo
+        # encima de los elementos móviles, como en un dibujado completo
+        titulo = fig.suptitle('🤖 Mecanismo Theo Jansen Modificado - Simulador Interactivo',
+                              fontsize=16, fontweight='bold', color='#00aaff', y=0.98)
+        titulo.set_animated(True)
         
         # Variables para animación
         self.animando = False
@@ -316,67 +554,132 @@ class MecanismoVerificacion:
         btn_pause = Button(ax_pause, '⏸ Pausa', color='#ff8800', hovercolor='#ffaa33')
         btn_reset = Button(ax_reset, '↺ Reset', color='#0088dd', hovercolor='#00aaff')
         
-        # Calcular trayectoria completa del pie
-        angulos_trayectoria = np.linspace(0, 2*np.pi, 360)
-        trayectoria_pie = []
-        for ang in angulos_trayectoria:
-            try:
-                pts = self.calcular_posiciones(ang)
-                trayectoria_pie.append(pts['G'])
-            except:
-                pass
-        trayectoria_pie = np.array(trayectoria_pie)
+        # Artistas persistentes del gráfico y fondo estático para blitting
+        self._artistas = None
+        self._clave_dibujo = None
+        self._fondo = None
+        self._region_ejes = None
+        self._region_slider = None
+        # (ángulo, longitudes, ω) del último cuadro pintado, para no repetirlo
+        self._estado_dibujado = None
+        
+        def pintar_animados():
+            # Mecanismo, slider y título, en el orden de un dibujado completo
+            self._dibujar_animados(ax)
+            fig.draw_artist(ax_slider)
+            fig.draw_artist(titulo)
+        
+        def redibujar():
+            # Blitting: restaurar el fondo estático y pintar solo lo que se mueve
+            # (solo los ejes del mecanismo y la franja del slider; los botones
+            # y el cuadro de texto no cambian entre cuadros)
+            if self._fondo is None or not fig.canvas.supports_blit:
+                fig.canvas.draw_idle()
+                return
+            fondo_ejes, fondo_slider = self._fondo
+            fig.canvas.restore_region(fondo_ejes)
+            fig.canvas.restore_region(fondo_slider)
+            pintar_animados()
+            fig.canvas.blit(self._region_ejes)
+            fig.canvas.blit(self._region_slider)
+        
+        def al_dibujar(event):
+            # Tras un redibujado completo se captura el fondo sin los elementos móviles.
+            # La etiqueta y el valor del slider quedan fuera de ax_slider.bbox: la franja
+            # los incluye y llega hasta el borde derecho para que el valor pueda crecer
+            franja = Bbox.union([ax_slider.bbox,
+                                 slider.label.get_window_extent(event.renderer),
+                                 slider.valtext.get_window_extent(event.renderer)])
+            self._region_slider = Bbox.from_extents(franja.x0 - 2, franja.y0 - 2,
+                                                    fig.bbox.x1, franja.y1 + 2)
+            # Los ejes más el título, que sobresale por encima de ellos
+            self._region_ejes = Bbox.union([ax.bbox,
+                                            titulo.get_window_extent(event.renderer).padded(2)])
+            self._fondo = (fig.canvas.copy_from_bbox(self._region_ejes),
+                           fig.canvas.copy_from_bbox(self._region_slider))
+            self._capturar_leyenda(ax)
+            pintar_animados()
         
         def actualizar(theta_grados):
-            ax.clear()
-            ax.set_facecolor('#2d2d2d')
-            ax.set_aspect('equal')
-            ax.grid(True, alpha=0.2, color='#555555', linestyle='--', linewidth=0.5)
-            ax.axhline(y=0, color='#888888', linewidth=0.8, alpha=0.5)
-            ax.axvline(x=0, color='#888888', linewidth=0.8, alpha=0.5)
+            # Nada cambió desde el último cuadro: no recalcular ni repintar
+            estado = (theta_grados, self._clave_longitudes(), self.velocidad_angular)
+            if estado == self._estado_dibujado:
+                return
             
             theta_OA = np.deg2rad(theta_grados)
+            trig = self._trig_grados(theta_grados)
             
-            try:
-                puntos = self.calcular_posiciones(theta_OA)
-            except:
-                ax.text(0.5, 0.5, f'❌ Error al resolver para {theta_grados}°', 
-                       transform=ax.transAxes, ha='center', va='center', fontsize=14, color='#ff4444')
-                fig.canvas.draw_idle()
+            # Si el mecanismo no cierra para este ángulo el núcleo devuelve NaN:
+            # se mantiene el último cuadro válido y se avisa en el panel
+            puntos = self.calcular_posiciones(theta_OA, trig)
+            if not np.isfinite(puntos['G']).all():
+                if self._artistas is not None:
+                    self._artistas['info'].set_text(
+                        f'❌ El mecanismo no cierra para θ = {theta_grados:.1f}°')
+                # El panel ya no muestra el último cuadro válido: volver a él
+                # debe repintarse aunque su estado coincida
+                self._estado_dibujado = None
+                redibujar()
                 return
             
-            # Calcular velocidad del punto G
-            vel_magnitud, vel_vector = self.calcular_velocidad_G(theta_OA, self.velocidad_angular)
-            
-            self._dibujar_mecanismo(ax, puntos, theta_grados, trayectoria_pie)
+            # Decoraciones y artistas se crean una sola vez
+            if self._artistas is None:
+                self._crear_artistas(ax, puntos)
             
-            # Información adicional en la esquina superior derecha
-            G = puntos['G']
-            en_contacto = abs(G[1]) < 0.5  # Considera contacto si está cerca del suelo (y ≈ 0)
+            # Trayectoria, leyenda y límites solo cambian con las longitudes
+            if self._clave_dibujo != self._clave_longitudes():
+                # Trayectoria completa del pie (en caché mientras no cambien las longitudes)
+                trayectoria_pie = self.calcular_trayectoria()
+                self._actualizar_geometria(ax, trayectoria_pie)
+                self._clave_dibujo = self._clave_longitudes()
+                self._fondo = None
             
-            vel_info = f"ω = {self.velocidad_angular:.3f} rad/s\n"
-            vel_info += f"v_G = {vel_magnitud:.3f} cm/s"
-            if en_contacto:
-                vel_info += " ⚠ CONTACTO"
-            
-            ax.text(0.98, 0.02, vel_info, transform=ax.transAxes,
-                   fontsize=11, ha='right', va='bottom',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='#3d3d3d', 
-                            edgecolor='#00ff88' if not en_contacto else '#ffaa00', 
-                            linewidth=2, alpha=0.9),
-                   color='#00ff88' if not en_contacto else '#ffaa00', 
-                   fontweight='bold')
+            # Calcular velocidad del punto G
+            vel_magnitud, vel_vector = self.calcular_velocidad_G(theta_OA, self.velocidad_angular, trig)
             
-            fig.canvas.draw_idle()
+            self._actualizar_artistas(puntos, theta_grados, vel_magnitud)
+            self._estado_dibujado = estado
+            redibujar()
+        
+        # Redibujado diferido: agrupa ráfagas de cambios del slider (arrastre,
+        # animación) en un solo cuadro cada 30 ms
+        self._theta_pendiente = None
+        self._dibujando = False
+        temporizador_redibujo = fig.canvas.new_timer(interval=30)
+        temporizador_redibujo.single_shot = True
+        
+        def programar_redibujo(theta_grados):
+            pendiente = self._theta_pendiente is not None
+            self._theta_pendiente = theta_grados
+            if not pendiente:
+                temporizador_redibujo.start()
+        
+        def redibujar_pendiente():
+            if self._theta_pendiente is None:
+                return
+            if self._dibujando:
+                # El cuadro anterior no ha terminado: reintentar en el siguiente ciclo
+                temporizador_redibujo.start()
+                return
+            theta_grados = self._theta_pendiente
+            self._theta_pendiente = None
+            self._dibujando = True
+            try:
+                actualizar(theta_grados)
+            finally:
+                self._dibujando = False
+        
+        temporizador_redibujo.add_callback(redibujar_pendiente)
         
-        def animar(frame):
+        def animar():
             if self.animando:
-                # Convertir velocidad angular (rad/s) a grados, asumiendo ~30 fps
-                delta_grados = np.rad2deg(self.velocidad_angular) * (1/30)
-                self.angulo_actual = (self.angulo_actual + delta_grados) % 360
+                # Avanzar un cuadro de la tabla (~30 fps); la vuelta es un
+                # módulo entero, sin deriva al acumular grados
+                if self._omega_animacion != self.velocidad_angular:
+                    self._preparar_animacion(self.velocidad_angular)
+                self._cuadro_animacion = (self._cuadro_animacion + 1) % len(self._angulos_animacion)
+                self.angulo_actual = self._angulos_animacion[self._cuadro_animacion]
                 slider.set_val(self.angulo_actual)
-                return []
-            return []
         
         def guardar_velocidad_temp(text):
             # Solo guarda el valor temporalmente cuando se escribe
@@ -391,13 +694,22 @@ class MecanismoVerificacion:
         
         def actualizar_velocidad(event):
             # Aplica la velocidad temporal cuando se presiona el botón
+            if self.velocidad_temp == self.velocidad_angular:
+                return
             self.velocidad_angular = self.velocidad_temp
             print(f"✓ Velocidad actualizada a: {self.velocidad_angular:.3f} rad/s")
+            # Refrescar v_G aunque la animación esté en pausa
+            programar_redibujo(slider.val)
         
         def play(event):
+            if self._omega_animacion != self.velocidad_angular:
+                self._preparar_animacion(self.velocidad_angular)
             self.animando = True
             if self.anim is None:
-                self.anim = FuncAnimation(fig, animar, interval=30, blit=True)
+                # Temporizador simple: cada cuadro se pinta con blitting desde actualizar
+                self.anim = fig.canvas.new_timer(interval=30)
+                self.anim.add_callback(animar)
+                self.anim.start()
         
         def pause(event):
             self.animando = False
@@ -405,10 +717,17 @@ class MecanismoVerificacion:
         def reset(event):
             self.animando = False
             self.angulo_actual = 0
+            self._cuadro_animacion = 0
             slider.set_val(0)
         
+        # El slider no fuerza un redibujado completo; se repinta junto al mecanismo
+        # (queda fuera del fondo capturado porque su valor cambia en cada cuadro)
+        slider.drawon = False
+        ax_slider.set_animated(True)
+        
         # Conectar eventos
-        slider.on_changed(actualizar)
+        fig.canvas.mpl_connect('draw_event', al_dibujar)
+        slider.on_changed(programar_redibujo)
         textbox_vel.on_submit(guardar_velocidad_temp)
         textbox_vel.on_text_change(guardar_velocidad_temp)
         btn_update_vel.on_clicked(actualizar_velocidad)
@@ -419,14 +738,14 @@ class MecanismoVerificacion:
         # Dibujar configuración inicial
         actualizar(0)
         
-        # Título principal con mejor estilo
-        fig.suptitle('🤖 Mecanismo Theo Jansen Modificado - Simulador Interactivo',
-                    fontsize=16, fontweight='bold', color='#00aaff', y=0.98)
-        
         plt.show()
     
-    def _dibujar_mecanismo(self, ax, puntos, theta_grados, trayectoria_pie=None):
-        """Método auxiliar para dibujar el mecanismo"""
+    def _crear_artistas(self, ax, puntos):
+        """
+        Dibuja una sola vez las decoraciones del gráfico y crea los artistas
+        Los artistas móviles son 'animated' y se pintan aparte con blitting;
+        lo que depende de las longitudes se ajusta en _actualizar_geometria
+        """
         O, A, B, C, D, E, F, G = [puntos[k] for k in ['O', 'A', 'B', 'C', 'D', 'E', 'F', 'G']]
         
         # Paleta de colores moderna
@@ -435,14 +754,19 @@ class MecanismoVerificacion:
         color_manivela = '#ff4444'
         color_eslabones = ['#4488ff', '#44ff88', '#ff88ff', '#ffaa44', '#88ffff', '#ff88aa']
         
-        # Dibujar trayectoria del pie con efecto brillante
-        if trayectoria_pie is not None and len(trayectoria_pie) > 0:
-            ax.plot(trayectoria_pie[:, 0], trayectoria_pie[:, 1], 
-                   color=color_trayectoria, linewidth=2, alpha=0.3, linestyle='--',
-                   label='Trayectoria completa', zorder=1)
-            # Añadir puntos en la trayectoria para efecto
-            ax.scatter(trayectoria_pie[::30, 0], trayectoria_pie[::30, 1], 
-                      color=color_trayectoria, s=10, alpha=0.5, zorder=1)
+        ax.set_facecolor('#2d2d2d')
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.2, color='#555555', linestyle='--', linewidth=0.5)
+        ax.axhline(y=0, color='#888888', linewidth=0.8, alpha=0.5)
+        ax.axvline(x=0, color='#888888', linewidth=0.8, alpha=0.5)
+        
+        # Trayectoria del pie con efecto brillante (datos en _actualizar_geometria)
+        trayectoria, = ax.plot([], [], 
+                              color=color_trayectoria, linewidth=2, alpha=0.3, linestyle='--',
+                              label='Trayectoria completa', zorder=1)
+        # Añadir puntos en la trayectoria para efecto
+        marcas_trayectoria = ax.scatter([], [], 
+                                        color=color_trayectoria, s=10, alpha=0.5, zorder=1)
         
         # Dibujar armazón (puntos fijos) con efecto de anclaje
         ax.plot([self.O[0], self.C[0]], [self.O[1], self.C[1]], 
@@ -450,76 +774,80 @@ class MecanismoVerificacion:
         ax.plot([self.O[0], self.D[0]], [self.O[1], self.D[1]], 
                 color='#555555', linewidth=2, linestyle=':', alpha=0.5, zorder=2)
         
-        ax.scatter([self.O[0], self.C[0], self.D[0]], 
+        fijos = ax.scatter([self.O[0], self.C[0], self.D[0]], 
                   [self.O[1], self.C[1], self.D[1]], 
                   color=color_fijos, s=200, marker='s', 
                   edgecolors='white', linewidths=2, zorder=5,
-                  label='Puntos fijos')
-        
-        # OA - Manivela (con grosor variable)
-        ax.plot([O[0], A[0]], [O[1], A[1]], color=color_manivela, 
-                linewidth=6, label=f'OA = {self.L_OA} cm (manivela)', 
-                solid_capstyle='round', zorder=4)
-        
-        # Eslabones con colores distintivos
-        eslabones = [
-            ([A[0], F[0]], [A[1], F[1]], f'AFB = 7.34 cm', 0),
-            ([B[0], C[0]], [B[1], C[1]], f'BC = {self.L_BC} cm', 1),
-            ([D[0], E[0]], [D[1], E[1]], f'DE = {self.L_DE} cm', 2),
-            ([E[0], F[0]], [E[1], F[1]], f'EF = {self.L_EF} cm', 3),
-            ([F[0], G[0]], [F[1], G[1]], f'FG = {self.L_FG} cm', 4),
-            ([E[0], G[0]], [E[1], G[1]], f'EG = {self.L_EG} cm', 5),
-        ]
-        
-        for x, y, label, idx in eslabones:
-            ax.plot(x, y, color=color_eslabones[idx], linewidth=4, 
-                   label=label, solid_capstyle='round', zorder=3)
+                  label='Puntos fijos', animated=True)
+        
+        # Eslabones con colores distintivos, en una sola colección de segmentos
+        # OA - Manivela (con grosor variable) va al final para quedar encima
+        colores = color_eslabones + [color_manivela]
+        grosores = [4] * len(color_eslabones) + [6]
+        eslabones = LineCollection([], colors=colores, linewidths=grosores,
+                                   capstyle='round', zorder=3, animated=True)
+        ax.add_collection(eslabones)
+        
+        # La colección aporta una sola entrada a la leyenda: usar líneas sustitutas
+        # (manivela primero, como antes)
+        orden = [len(colores) - 1] + list(range(len(colores) - 1))
+        entradas_eslabones = [Line2D([], [], color=colores[i], linewidth=grosores[i],
+                                     solid_capstyle='round')
+                              for i in orden]
         
         # Triángulo EFG con gradiente visual
         triangle = Polygon([E, F, G], alpha=0.15, color='#00ffff', 
-                          edgecolor='#00ffff', linewidth=2, zorder=2)
+                          edgecolor='#00ffff', linewidth=2, zorder=2, animated=True)
         ax.add_patch(triangle)
         
         # Marcar puntos móviles con estilo
-        puntos_moviles = {'A': A, 'B': B, 'E': E, 'F': F}
-        for nombre, punto in puntos_moviles.items():
-            ax.scatter(punto[0], punto[1], color='white', s=100, 
-                      edgecolors='black', linewidths=2, zorder=6)
-            ax.text(punto[0]+0.3, punto[1]+0.3, nombre, fontsize=11, 
-                   fontweight='bold', color='white', zorder=7,
-                   bbox=dict(boxstyle='circle', facecolor='#3d3d3d', 
-                            edgecolor='white', alpha=0.7, pad=0.3))
+        moviles = ax.scatter([A[0], B[0], E[0], F[0]], [A[1], B[1], E[1], F[1]],
+                            color='white', s=100, edgecolors='black', linewidths=2,
+                            zorder=6, animated=True)
+        nombres_moviles = []
+        for nombre in ['A', 'B', 'E', 'F']:
+            texto = ax.text(0, 0, nombre, fontsize=11, 
+                           fontweight='bold', color='white', zorder=7, animated=True,
+                           bbox=dict(boxstyle='circle', facecolor='#3d3d3d', 
+                                    edgecolor='white', alpha=0.7, pad=0.3))
+            nombres_moviles.append(texto)
         
         # Etiquetar puntos fijos con mejor contraste
         for nombre, punto, offset in [('O', O, (-0.5, -0.5)), 
                                        ('C', C, (-0.5, -0.5)), 
                                        ('D', D, (0.3, 0.3))]:
             ax.text(punto[0]+offset[0], punto[1]+offset[1], nombre, 
-                   fontsize=12, fontweight='bold', color=color_fijos, zorder=7,
+                   fontsize=12, fontweight='bold', color=color_fijos, zorder=7, animated=True,
                    bbox=dict(boxstyle='round', facecolor='#1e1e1e', 
                             edgecolor=color_fijos, alpha=0.8, pad=0.4))
         
         # Marcar el pie con efecto especial
-        ax.scatter(G[0], G[1], color='#ffff00', s=400, marker='*', 
-                  edgecolors='#ff8800', linewidths=3, zorder=8,
-                  label='G (PIE)')
+        pie = ax.scatter(G[0], G[1], color='#ffff00', s=400, marker='*', 
+                        edgecolors='#ff8800', linewidths=3, zorder=8,
+                        animated=True)
+        # La leyenda se dibuja en el fondo estático: usa un sustituto, no el artista móvil
+        entrada_pie = Line2D([], [], linestyle='none', marker='*', markersize=20,
+                             markerfacecolor='#ffff00', markeredgecolor='#ff8800',
+                             markeredgewidth=3, label='G (PIE)')
         # Añadir círculo alrededor del pie
         circle = Circle((G[0], G[1]), 0.3, color='#ffff00', 
                        fill=False, linewidth=2, linestyle='--', 
-                       alpha=0.5, zorder=7)
+                       alpha=0.5, zorder=7, animated=True)
         ax.add_patch(circle)
         
         # Panel de información con mejor diseño
-        info_text = f"θ = {theta_grados:6.1f}°\n"
-        info_text += f"Pie: ({G[0]:5.2f}, {G[1]:5.2f}) cm\n"
-        altura_pie = G[1]
-        info_text += f"h = {altura_pie:5.2f} cm"
+        info = ax.text(0.02, 0.98, '', transform=ax.transAxes, 
+                       fontsize=11, verticalalignment='top', family='monospace',
+                       bbox=dict(boxstyle='round,pad=0.8', facecolor='#3d3d3d', 
+                                edgecolor='#00aaff', linewidth=2, alpha=0.9),
+                       color='#ffffff', animated=True)
         
-        ax.text(0.02, 0.98, info_text, transform=ax.transAxes, 
-                fontsize=11, verticalalignment='top', family='monospace',
-                bbox=dict(boxstyle='round,pad=0.8', facecolor='#3d3d3d', 
-                         edgecolor='#00aaff', linewidth=2, alpha=0.9),
-                color='#ffffff')
+        # Información de velocidad en la esquina inferior derecha
+        velocidad = ax.text(0.98, 0.02, '', transform=ax.transAxes,
+                            fontsize=11, ha='right', va='bottom',
+                            bbox=dict(boxstyle='round,pad=0.5', facecolor='#3d3d3d', 
+                                     edgecolor='#00ff88', linewidth=2, alpha=0.9),
+                            color='#00ff88', fontweight='bold', animated=True)
         
         # Configuración de ejes con mejor estilo
         ax.set_xlabel('X (cm)', fontsize=13, fontweight='bold', color='#aaaaaa')
@@ -527,42 +855,166 @@ class MecanismoVerificacion:
         ax.set_title('Configuración 7 Barras | 3 Puntos Fijos', 
                     fontsize=12, color='#888888', pad=10)
         
+        ax.tick_params(colors='#888888', labelsize=10)
+        
+        self._artistas = {
+            'trayectoria': trayectoria,
+            'marcas_trayectoria': marcas_trayectoria,
+            'fijos': fijos,
+            'entradas_eslabones': entradas_eslabones,
+            'eslabones': eslabones,
+            'triangulo': triangle,
+            'moviles': moviles,
+            'nombres_moviles': nombres_moviles,
+            'pie': pie,
+            'entrada_pie': entrada_pie,
+            'circulo_pie': circle,
+            'info': info,
+            'velocidad': velocidad,
+            # La leyenda rasterizada (ver _capturar_leyenda); se rellena tras cada
+            # dibujado completo
+            'imagen_leyenda': ax.figure.figimage(np.zeros((1, 1, 4)), animated=True),
+        }
+    
+    def _actualizar_geometria(self, ax, trayectoria_pie):
+        """
+        Ajusta lo que depende de las longitudes de los eslabones:
+        trayectoria del pie, leyenda y límites de los ejes
+        """
+        artistas = self._artistas
+        
+        artistas['trayectoria'].set_data(trayectoria_pie[:, 0], trayectoria_pie[:, 1])
+        artistas['marcas_trayectoria'].set_offsets(trayectoria_pie[::10])
+        
+        # Etiquetas en el orden de la leyenda (manivela primero)
+        etiquetas = [f'OA = {self.L_OA} cm (manivela)', f'AFB = 7.34 cm',
+                     f'BC = {self.L_BC} cm', f'DE = {self.L_DE} cm', f'EF = {self.L_EF} cm',
+                     f'FG = {self.L_FG} cm', f'EG = {self.L_EG} cm']
+        for entrada, etiqueta in zip(artistas['entradas_eslabones'], etiquetas):
+            entrada.set_label(etiqueta)
+        
         # Leyenda con mejor diseño - ubicación centro derecha para no tapar nada
-        legend = ax.legend(loc='center right', fontsize=9, framealpha=0.9,
+        handles = [artistas['trayectoria'], artistas['fijos'],
+                   *artistas['entradas_eslabones'], artistas['entrada_pie']]
+        legend = ax.legend(handles=handles, loc='center right', fontsize=9, framealpha=0.9,
                           facecolor='#2d2d2d', edgecolor='#555555', 
                           labelcolor='#cccccc', bbox_to_anchor=(0.99, 0.5))
         legend.get_frame().set_linewidth(1.5)
+        legend.set_animated(True)
         
-        # Calcular límites automáticos basados en todos los puntos del mecanismo
-        if trayectoria_pie is not None and len(trayectoria_pie) > 0:
-            # Considerar trayectoria del pie
-            x_min, x_max = trayectoria_pie[:, 0].min(), trayectoria_pie[:, 0].max()
-            y_min, y_max = trayectoria_pie[:, 1].min(), trayectoria_pie[:, 1].max()
-            
-            # Considerar todos los puntos del mecanismo actual
-            todos_puntos = np.array([O, A, B, C, D, E, F, G])
-            x_min = min(x_min, todos_puntos[:, 0].min())
-            x_max = max(x_max, todos_puntos[:, 0].max())
-            y_min = min(y_min, todos_puntos[:, 1].min())
-            y_max = max(y_max, todos_puntos[:, 1].max())
-            
-            # Añadir margen del 20% para mejor visualización
-            x_margin = (x_max - x_min) * 0.20
-            y_margin = (y_max - y_min) * 0.20
-            
-            x_min -= x_margin
-            x_max += x_margin
-            y_min -= y_margin
-            y_max += y_margin
-            
-            ax.set_xlim(x_min, x_max)
-            ax.set_ylim(y_min, y_max)
-        else:
-            # Límites por defecto si no hay trayectoria
-            ax.set_xlim(-12, 8)
-            ax.set_ylim(-5, 12)
+        # Orden de pintado de los artistas animados: el mismo que un dibujado completo
+        # (zorder, y a igual zorder orden de creación). Los apoyos, sus etiquetas y la
+        # leyenda no se mueven, pero van encima de los eslabones y por eso no pueden
+        # quedar en el fondo capturado. La leyenda se pinta como imagen en su lugar
+        imagen_leyenda = artistas['imagen_leyenda']
+        imagen_leyenda.set_zorder(legend.get_zorder())
+        animados = [artista for artista in ax.get_children()
+                    if artista.get_animated() and artista is not legend]
+        artistas['orden_dibujo'] = sorted(animados + [imagen_leyenda],
+                                          key=lambda artista: artista.get_zorder())
         
-        ax.tick_params(colors='#888888', labelsize=10)
+        # Límites fijos: deben contener el mecanismo en cualquier ángulo
+        # para que el fondo capturado sirva en todos los cuadros
+        x_min, x_max, y_min, y_max = self._limites_grafico()
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(y_min, y_max)
+    
+    def _actualizar_artistas(self, puntos, theta_grados, vel_magnitud):
+        """Actualiza los datos de los artistas móviles para el ángulo actual"""
+        O, A, B, C, D, E, F, G = [puntos[k] for k in ['O', 'A', 'B', 'C', 'D', 'E', 'F', 'G']]
+        artistas = self._artistas
+        
+        # Mismo orden que los colores de la colección: AFB, BC, DE, EF, FG, EG, OA
+        artistas['eslabones'].set_segments(
+            np.array([[A, F], [B, C], [D, E], [E, F], [F, G], [E, G], [O, A]]))
+        
+        artistas['triangulo'].set_xy([E, F, G])
+        
+        artistas['moviles'].set_offsets([A, B, E, F])
+        for texto, punto in zip(artistas['nombres_moviles'], [A, B, E, F]):
+            texto.set_position((punto[0]+0.3, punto[1]+0.3))
+        
+        artistas['pie'].set_offsets([G])
+        artistas['circulo_pie'].set_center((G[0], G[1]))
+        
+        info_text = f"θ = {theta_grados:6.1f}°\n"
+        info_text += f"Pie: ({G[0]:5.2f}, {G[1]:5.2f}) cm\n"
+        altura_pie = G[1]
+        info_text += f"h = {altura_pie:5.2f} cm"
+        artistas['info'].set_text(info_text)
+        
+        # Información adicional en la esquina inferior derecha
+        en_contacto = abs(G[1]) < 0.5  # Considera contacto si está cerca del suelo (y ≈ 0)
+        
+        vel_info = f"ω = {self.velocidad_angular:.3f} rad/s\n"
+        vel_info += f"v_G = {vel_magnitud:.3f} cm/s"
+        if en_contacto:
+            vel_info += " ⚠ CONTACTO"
+        
+        color_vel = '#00ff88' if not en_contacto else '#ffaa00'
+        artistas['velocidad'].set_text(vel_info)
+        artistas['velocidad'].set_color(color_vel)
+        artistas['velocidad'].get_bbox_patch().set_edgecolor(color_vel)
+    
+    def _capturar_leyenda(self, ax):
+        """
+        Rasteriza la leyenda una sola vez en una imagen RGBA transparente
+        Componer sus textos cuesta más que todo el mecanismo; pegar la imagen
+        en cada cuadro es casi gratis y la mantiene encima de los eslabones
+        """
+        leyenda = ax.get_legend()
+        if self._artistas is None or leyenda is None:
+            return
+        fig = ax.figure
+        ancho, alto = int(fig.bbox.width), int(fig.bbox.height)
+        capa = RendererAgg(ancho, alto, fig.dpi)
+        leyenda.draw(capa)
+        
+        caja = leyenda.get_window_extent(capa).padded(2)
+        x0, y0 = max(int(caja.x0), 0), max(int(caja.y0), 0)
+        x1, y1 = min(math.ceil(caja.x1), ancho), min(math.ceil(caja.y1), alto)
+        # El búfer empieza por la fila superior
+        pixeles = np.asarray(capa.buffer_rgba())[alto - y1:alto - y0, x0:x1]
+        
+        imagen = self._artistas['imagen_leyenda']
+        imagen.set_data(pixeles.copy())
+        imagen.ox, imagen.oy = x0, y0
+    
+    def _dibujar_animados(self, ax):
+        """Pinta los artistas animados sobre el fondo actual del lienzo, por zorder"""
+        if self._artistas is None:
+            return
+        for artista in self._artistas.get('orden_dibujo', ()):
+            ax.draw_artist(artista)
+    
+    def _limites_grafico(self, n_muestras=72):
+        """
+        Límites de los ejes que contienen todos los puntos del mecanismo
+        y la trayectoria del pie durante una vuelta completa de la manivela
+        (con margen del 20%)
+        """
+        # Sin pasar por calcular_posiciones: el muestreo no debe reemplazar
+        # la última solución mostrada (caché y semilla de las ramas)
+        clave = self._clave_longitudes()
+        muestras = []
+        for theta in np.linspace(0, 2*np.pi, n_muestras, endpoint=False):
+            puntos = self._resolver_posiciones(clave, theta)
+            muestras.extend(puntos.values())
+        todos_puntos = np.array(muestras)
+        x_min, x_max = np.nanmin(todos_puntos[:, 0]), np.nanmax(todos_puntos[:, 0])
+        y_min, y_max = np.nanmin(todos_puntos[:, 1]), np.nanmax(todos_puntos[:, 1])
+        
+        # Considerar trayectoria del pie: sus extremos ya están en la caché
+        self.calcular_trayectoria()
+        _, _, pie_x_min, pie_x_max, pie_y_min, pie_y_max = self._trayectoria_cache
+        x_min, x_max = min(x_min, pie_x_min), max(x_max, pie_x_max)
+        y_min, y_max = min(y_min, pie_y_min), max(y_max, pie_y_max)
+        
+        # Añadir margen del 20% para mejor visualización
+        x_margin = (x_max - x_min) * 0.20
+        y_margin = (y_max - y_min) * 0.20
+        
+        return x_min - x_margin, x_max + x_margin, y_min - y_margin, y_max + y_margin
     
     def verificar_colinealidad(self, P1, P2, P3, tolerancia=0.1):
         """Verifica si tres puntos son colineales"""